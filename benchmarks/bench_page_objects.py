@@ -0,0 +1,216 @@
+# benchmarks/bench_page_objects.py
+
+"""Offline micro-benchmarks for page-object and fixture overhead.
+
+Runs against a static local HTML fixture so framework changes in BasePage,
+FlexportLandingPage or conftest can be timed without the portal.
+
+Only the browser context setup shared through conftest.open_context is
+covered; the portal login steps in login_as_user need the live portal and
+are not benchmarked.
+
+Usage (from the repo root):
+    python -m benchmarks.bench_page_objects                  # compare to baseline
+    python -m benchmarks.bench_page_objects --save-baseline  # record new baseline
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from playwright.sync_api import Browser, sync_playwright
+from conftest import open_context
+from pages.flexport_portal_landing_page import FlexportLandingPage
+
+BENCH_DIR = Path(__file__).resolve().parent
+FIXTURE_PAGE = BENCH_DIR / "fixtures" / "flexport_landing.html"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+BENCHMARK_NAMES = (
+    'context_creation',
+    'fill_citation_round_trip',
+    'fill_plate_round_trip',
+    'select_state',
+    'get_performance_metrics',
+    'take_screenshot',
+)
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """Reduce raw timings (ms) to the statistics stored in the baseline"""
+    ordered = sorted(samples_ms)
+    # Nearest-rank percentile
+    p95_index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+    return {
+        'runs': len(ordered),
+        'min': ordered[0],
+        'max': ordered[-1],
+        'mean': statistics.mean(ordered),
+        'median': statistics.median(ordered),
+        'stdev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        'p95': ordered[p95_index],
+    }
+
+
+def run_benchmark(operation: Callable[[], object], warmup: int, repetitions: int) -> Dict[str, float]:
+    """Run warmup iterations untimed, then time each repetition"""
+    for _ in range(warmup):
+        operation()
+
+    samples = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def build_benchmarks(browser: Browser, portal: FlexportLandingPage) -> Dict[str, Callable[[], object]]:
+    """Map benchmark names to zero-argument operations"""
+
+    def context_creation():
+        context, _ = open_context(browser)
+        context.close()
+
+    def fill_citation_round_trip():
+        portal.fill_citation("CIT789456")
+        return portal.get_citation_value()
+
+    def fill_plate_round_trip():
+        portal.fill_plate("TEST123")
+        return portal.get_plate_value()
+
+    def select_state():
+        success, _ = portal.select_state("ALASKA")
+        assert success, "ALASKA missing from fixture dropdown"
+
+    return {
+        'context_creation': context_creation,
+        'fill_citation_round_trip': fill_citation_round_trip,
+        'fill_plate_round_trip': fill_plate_round_trip,
+        'select_state': select_state,
+        'get_performance_metrics': lambda: portal.get_performance_metrics(),
+        'take_screenshot': lambda: portal.take_screenshot("bench"),
+    }
+
+
+def run_suite(warmup: int, repetitions: int, only: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    """Launch a headless browser on the fixture page and run every benchmark"""
+    results = {}
+    with tempfile.TemporaryDirectory() as screenshot_dir, sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            context, page = open_context(browser)
+            page.goto(FIXTURE_PAGE.as_uri())
+            page.wait_for_load_state("load")
+            portal = FlexportLandingPage(page)
+            # Keep benchmark screenshots out of the repo
+            portal.screenshot_dir = screenshot_dir
+
+            for name, operation in build_benchmarks(browser, portal).items():
+                if only and name not in only:
+                    continue
+                results[name] = run_benchmark(operation, warmup, repetitions)
+
+            context.close()
+        finally:
+            browser.close()
+    return results
+
+
+def compare_to_baseline(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                        threshold: float, min_delta_ms: float) -> List[str]:
+    """Return a message for each benchmark whose median regressed past the threshold"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or 'median' not in previous:
+            continue
+        delta = current['median'] - previous['median']
+        # Require both a relative and an absolute slowdown so sub-ms jitter is ignored
+        if delta > previous['median'] * threshold and delta > min_delta_ms:
+            message = f"{name}: median {current['median']:.2f}ms vs baseline {previous['median']:.2f}ms"
+            if previous['median'] > 0:
+                message += f" (+{delta / previous['median']:.0%})"
+            regressions.append(message)
+    return regressions
+
+
+def missing_from_baseline(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> List[str]:
+    """Return benchmarks that ran but have no usable baseline median to compare against"""
+    return [name for name in results if 'median' not in baseline.get(name, {})]
+
+
+def print_report(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]):
+    """Print a summary table, with change in median when a baseline exists"""
+    print("\n=== PAGE OBJECT BENCHMARKS (ms) ===")
+    print(f"{'benchmark':<26}{'median':>9}{'mean':>9}{'stdev':>9}{'min':>9}{'p95':>9}{'vs base':>10}")
+    for name, stats in results.items():
+        change = ""
+        if baseline.get(name, {}).get('median', 0) > 0:
+            change = f"{stats['median'] / baseline[name]['median'] - 1:+.0%}"
+        print(f"{name:<26}{stats['median']:>9.2f}{stats['mean']:>9.2f}{stats['stdev']:>9.2f}"
+              f"{stats['min']:>9.2f}{stats['p95']:>9.2f}{change:>10}")
+    print("===================================\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline page-object micro-benchmarks")
+    parser.add_argument("--warmup", type=int, default=5, help="untimed iterations per benchmark")
+    parser.add_argument("--repetitions", type=int, default=30, help="timed iterations per benchmark")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="merge this run into the baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative slowdown of the median before failing (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="ignore slowdowns smaller than this many ms")
+    parser.add_argument("--only", nargs="+", metavar="NAME", choices=BENCHMARK_NAMES,
+                        help=f"run only the named benchmarks: {', '.join(BENCHMARK_NAMES)}")
+    args = parser.parse_args(argv)
+
+    if args.repetitions < 2:
+        parser.error("--repetitions must be at least 2 to compute a standard deviation")
+
+    results = run_suite(args.warmup, args.repetitions, args.only)
+    if not results:
+        print("✗ No benchmarks were run")
+        return 1
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    print_report(results, baseline)
+
+    if args.save_baseline:
+        # Merge so a partial --only run keeps the other benchmarks' baselines
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"✓ Baseline saved: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"⚠ No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    for name in missing_from_baseline(results, baseline):
+        print(f"⚠ No baseline median for {name}; not checked for regressions")
+
+    regressions = compare_to_baseline(results, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print("✗ Performance regressions detected:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+
+    print("✅ No significant regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+# benchmarks/test_bench_page_objects.py
+
+from benchmarks.bench_page_objects import (
+    BENCHMARK_NAMES,
+    build_benchmarks,
+    compare_to_baseline,
+    main,
+    missing_from_baseline,
+    summarize,
+)
+import pytest
+
+def test_summarize_statistics():
+    """Summary stats use a nearest-rank p95"""
+    stats = summarize([float(n) for n in range(30, 0, -1)])
+    assert stats['runs'] == 30
+    assert stats['min'] == 1.0
+    assert stats['max'] == 30.0
+    assert stats['median'] == 15.5
+    assert stats['p95'] == 29.0  # ceil(0.95 * 30) = 29th of 30
+
+def test_summarize_single_sample():
+    stats = summarize([4.0])
+    assert stats['p95'] == 4.0
+    assert stats['stdev'] == 0.0
+
+def test_compare_flags_regression_past_both_thresholds():
+    baseline = {'a': {'median': 10.0}}
+    regressions = compare_to_baseline({'a': {'median': 14.0}}, baseline, 0.25, 1.0)
+    assert regressions == ["a: median 14.00ms vs baseline 10.00ms (+40%)"]
+
+def test_compare_ignores_small_or_relative_only_slowdowns():
+    baseline = {'fast': {'median': 0.5}, 'slow': {'median': 100.0}}
+    results = {'fast': {'median': 1.2}, 'slow': {'median': 110.0}}
+    assert compare_to_baseline(results, baseline, 0.25, 1.0) == []
+
+def test_compare_handles_zero_and_missing_baseline_median():
+    baseline = {'zero': {'median': 0.0}, 'broken': {'mean': 1.0}}
+    results = {'zero': {'median': 3.0}, 'broken': {'median': 3.0}, 'new': {'median': 3.0}}
+    assert compare_to_baseline(results, baseline, 0.25, 1.0) == [
+        "zero: median 3.00ms vs baseline 0.00ms"
+    ]
+    assert missing_from_baseline(results, baseline) == ['broken', 'new']
+
+def test_benchmark_names_match_suite():
+    assert tuple(build_benchmarks(None, None)) == BENCHMARK_NAMES
+
+def test_unknown_only_name_is_rejected():
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--only", "select-state"])
+    assert excinfo.value.code == 2
@@ -1,20 +1,25 @@
 # conftest.py
 
 import pytest
-from playwright.sync_api import sync_playwright, Page, BrowserContext
-from typing import Generator
+from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext
+from typing import Generator, Tuple
 
 @pytest.fixture(scope="function")
 def authenticated_page() -> Generator[Page, None, None]:
     """Default login fixture using Kasey1."""
     yield from login_as_user("Kasey1", "Parking123!!!", "301405")
 
+def open_context(browser: Browser) -> Tuple[BrowserContext, Page]:
+    """Create a fresh browser context and page for a test session."""
+    context = browser.new_context()
+    page = context.new_page()
+    return context, page
+
 def login_as_user(username: str, password: str, entity_uid: str) -> Generator[Page, None, None]:
     """Reusable login function for impersonating different users."""
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
+        context, page = open_context(browser)
         
         # Navigate to impersonation login
         impersonation_url = (
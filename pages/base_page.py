@@ -13,6 +13,7 @@ class BasePage:
     def __init__(self, page: Page):
         self.page = page
         self.timeout = 30000  # 30 seconds default
+        self.screenshot_dir = "screenshots"
     
     def wait_for_element(self, selector: str, timeout: Optional[int] = None) -> Locator:
         """Wait for element to be visible and return it"""
@@ -49,7 +50,7 @@ class BasePage:
         """Take screenshot with timestamp"""
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"screenshots/{name}_{timestamp}.png"
+        filename = f"{self.screenshot_dir}/{name}_{timestamp}.png"
         self.page.screenshot(path=filename)
         logger.info(f"Screenshot saved: {filename}")
         return filename